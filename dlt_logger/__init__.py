@@ -20,6 +20,9 @@ Basic Usage:
     >>> logger = dlt_logger.get_logger("my_module")
     >>> logger.info("Application started")
     >>>
+    >>> # Logs are written in the background; flush before reading them back
+    >>> dlt_logger.flush()
+    >>>
     >>> # Use decorator for automatic function logging
     >>> @dlt_logger.log_execution("data_processing")
     ... def process_data():
@@ -44,6 +47,7 @@ Workflow Management:
 from .logging import (
     LogEntry,
     TPLogger,
+    flush,
     get_logger,
     log_execution,
     setup_logging,
@@ -55,6 +59,7 @@ from .utils import (
     detect_project_root,
     generate_sample_log_data,
     get_database_info_from_config,
+    iter_sample_log_data,
     resolve_project_path,
 )
 
@@ -67,6 +72,7 @@ __all__ = [
     "get_logger",
     "log_execution",
     "timed_operation",
+    "flush",
     "TPLogger",
     "LogEntry",
     "LoggerConfig",
@@ -74,5 +80,6 @@ __all__ = [
     "detect_project_root",
     "generate_sample_log_data",
     "get_database_info_from_config",
+    "iter_sample_log_data",
     "resolve_project_path",
 ]
@@ -43,7 +43,8 @@ Note:
 
 import warnings
 from .athena import job_logs_resource, transfer_logs_to_athena
-from .pipeline import RUN_ID, get_pipeline, job_logs
+from .pipeline import RUN_ID, get_pipeline, job_logs, reset_pipeline
+from .writer import flush, start_writer, write_log_entry
 
 
 def transfer_to_athena() -> bool:
@@ -66,7 +67,11 @@ def transfer_to_athena() -> bool:
 
 __all__ = [
     "get_pipeline",
+    "reset_pipeline",
     "job_logs",
+    "write_log_entry",
+    "start_writer",
+    "flush",
     "RUN_ID",
     "job_logs_resource",
     "transfer_logs_to_athena",
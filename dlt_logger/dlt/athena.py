@@ -10,6 +10,17 @@ import duckdb
 from ..setup import get_config
 from ..logging.models import LogEntry
 from .columns_schema import JOB_LOGS_COLUMNS
+from .writer import flush
+
+
+# Columns uploaded to Athena, in LogEntry field order
+_LOG_ENTRY_COLUMNS = tuple(LogEntry.model_fields)
+_REQUIRED_COLUMNS = ("id", "project_name", "run_id", "timestamp", "level")
+
+# Parquet compression for files staged to S3, unless configured otherwise
+_PARQUET_COMPRESSION = "zstd"
+
+_TRANSFER_PIPELINE_NAME = "athena_log_transfer"
 
 
 def _get_logger():
@@ -34,11 +45,14 @@ def _create_job_logs_resource():
     )
     def job_logs_resource_impl(
         db_path: str, dataset_name: str, batch_size: int = 10000
-    ) -> Iterator[list[dict[str, Any]]]:
+    ) -> Iterator[Any]:
         """
         A DLT resource that reads job logs from the source DuckDB database in batches.
         Uses batch processing and parallelization for improved performance.
 
+        Batches are yielded as Arrow record batches, so rows go from DuckDB
+        to the parquet files staged for Athena without becoming Python objects.
+
         Args:
             db_path: Path to the source DuckDB database
             dataset_name: Name of the dataset containing job_logs table
@@ -46,38 +60,18 @@ def _create_job_logs_resource():
         """
         # A resource should be self-contained and create its own connection
         with duckdb.connect(db_path, read_only=True) as conn:
-            # Query all columns from the job_logs table without expensive ORDER BY
+            # Project only LogEntry fields and drop rows missing required ones
+            # in DuckDB, so no per-row model validation is needed here
             query = f"""
             SELECT
-                *
+                {", ".join(_LOG_ENTRY_COLUMNS)}
             FROM {dataset_name}.{config.table_name}
+            WHERE {" AND ".join(f"{c} IS NOT NULL" for c in _REQUIRED_COLUMNS)}
             """
 
-            cursor = conn.execute(query)
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-
             # Process rows in batches for better performance
-            while True:
-                batch_rows = cursor.fetchmany(batch_size)
-                if not batch_rows:
-                    break
-
-                # Convert batch to LogEntry models to ensure only valid fields are uploaded
-                batch_data = []
-                for row in batch_rows:
-                    row_dict = dict(zip(columns, row))
-                    try:
-                        # Validate through LogEntry model and get only defined fields
-                        log_entry = LogEntry(**row_dict)
-                        batch_data.append(log_entry.model_dump())
-                    except Exception as e:
-                        # Skip invalid entries but log the issue
-                        print(f"[ATHENA] Skipping invalid log entry: {e}")
-                        continue
-                
-                if batch_data:
-                    yield batch_data
-    
+            yield from conn.execute(query).fetch_record_batch(batch_size)
+
     return job_logs_resource_impl
 
 
@@ -125,6 +119,9 @@ def transfer_logs_to_athena() -> bool:
             )
             return False
 
+        # Make sure queued log rows are in DuckDB before reading them
+        flush()
+
         # Check if source database exists
         if not os.path.exists(config.db_path):
             logger.log_action(
@@ -137,9 +134,25 @@ def transfer_logs_to_athena() -> bool:
         # Log configuration validation success
         logger.info("Logging: Athena configuration validated successfully")
 
+        # Settings scoped to the transfer pipeline, leaving other pipelines
+        # untouched. Arrow batches skip dlt's row normalizer, so have the
+        # parquet normalizer add _dlt_load_id/_dlt_id to the Athena table
+        normalize_section = f"{_TRANSFER_PIPELINE_NAME}.normalize"
+        dlt.config[f"{normalize_section}.parquet_normalizer.add_dlt_load_id"] = True
+        dlt.config[f"{normalize_section}.parquet_normalizer.add_dlt_id"] = True
+
+        # zstd shrinks the parquet files staged to S3 compared to dlt's
+        # snappy default
+        compression_key = f"{normalize_section}.data_writer.compression"
+        if (
+            dlt.config.get(compression_key) is None
+            and dlt.config.get("data_writer.compression") is None
+        ):
+            dlt.config[compression_key] = _PARQUET_COMPRESSION
+
         # Create a clean, isolated pipeline to Athena destination
         transfer_pipeline = dlt.pipeline(
-            pipeline_name="athena_log_transfer",
+            pipeline_name=_TRANSFER_PIPELINE_NAME,
             destination=dlt.destinations.athena(lakeformation_config=None),
             dataset_name=config.dataset_name,  # Use configured dataset name
         )
@@ -148,6 +161,10 @@ def transfer_logs_to_athena() -> bool:
 
         # Run the pipeline with the resource - pass parameters to avoid conflicts
         logger.info("Logging: Starting data transfer to Athena...")
+
+        # Write the rows logged above too, and release the writer's connection
+        # so the resource can open the database read-only
+        flush()
         transfer_pipeline.run(job_logs_resource(config.db_path, config.dataset_name))
 
         # Log successful completion
@@ -1,9 +1,20 @@
 """Pipeline management for tp-logger using DLT Hub."""
 
-from typing import Optional
+import os
+import threading
+import time
+from functools import cache
+from typing import Any, Optional, Union
 from uuid import uuid4
 
 import dlt
+import duckdb
+from loguru import logger
+
+try:
+    import pyarrow as pa
+except ImportError:  # Optional: installed with the athena extra
+    pa = None
 
 from ..logging.models import LogEntry
 from ..setup import get_config
@@ -11,70 +22,302 @@ from .columns_schema import JOB_LOGS_COLUMNS
 
 # Global pipeline instance
 _pipeline: Optional[dlt.Pipeline] = None
+_pipeline_lock = threading.Lock()
 
 # Generate a unique run ID for this session
 RUN_ID = uuid4()
 
+# Pipeline whose job_logs table has been created by a DLT run; batches for
+# it can then be inserted into DuckDB directly
+_direct_insert_pipeline: Optional[dlt.Pipeline] = None
+
+# Connection for direct inserts, kept open between batches. Only the writer
+# thread uses it, so it needs no lock
+_connection: Optional[duckdb.DuckDBPyConnection] = None
+_connection_path: Optional[str] = None
+
+# Connections inherited from the parent by a forked child. They are kept
+# referenced and never closed: closing one would checkpoint the parent's
+# database from the child
+_inherited_connections: list[duckdb.DuckDBPyConnection] = []
+
+# Arrow schema for job_logs batches, in LogEntry field order
+_ARROW_SCHEMA = (
+    pa.schema(
+        [
+            ("id", pa.string()),
+            ("project_name", pa.string()),
+            ("module_name", pa.string()),
+            ("function_name", pa.string()),
+            ("run_id", pa.string()),
+            # Timezone-aware so DuckDB stores the same instant whether the
+            # batch goes through dlt or a direct insert
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("level", pa.string()),
+            ("action", pa.string()),
+            ("message", pa.string()),
+            ("success", pa.bool_()),
+            ("status_code", pa.int64()),
+            ("duration_ms", pa.int64()),
+            ("request_method", pa.string()),
+        ]
+    )
+    if pa is not None
+    else None
+)
+
+
+def _create_pipeline() -> dlt.Pipeline:
+    """Create the DLT pipeline for the current config."""
+    config = get_config()
+
+    # Diagnostics go through loguru so they respect the configured level
+    logger.debug(
+        "[LOGS PIPELINE] Creating pipeline {} (database: {}, dataset: {})",
+        config.pipeline_name,
+        config.db_path,
+        config.dataset_name,
+    )
+
+    # Ensure directory exists; exist_ok makes a separate exists() check moot
+    db_dir = os.path.dirname(config.db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+
+    try:
+        # Set DLT working directory to be relative to the project root
+        # This ensures .dlt folder is created in the right place
+        dlt_working_dir = os.path.join(config.project_root, ".dlt_pipeline")
+        os.makedirs(dlt_working_dir, exist_ok=True)
+
+        # Arrow batches skip dlt's row normalizer, which is what adds the
+        # _dlt_load_id/_dlt_id columns; keep them for this pipeline so
+        # both batch formats share one table schema
+        normalizer_section = f"{config.pipeline_name}.normalize.parquet_normalizer"
+        dlt.config[f"{normalizer_section}.add_dlt_load_id"] = True
+        dlt.config[f"{normalizer_section}.add_dlt_id"] = True
+
+        pipeline = dlt.pipeline(
+            pipeline_name=config.pipeline_name,
+            destination=dlt.destinations.duckdb(
+                credentials=f"duckdb:///{config.db_path}"
+            ),
+            dataset_name=config.dataset_name,
+            pipelines_dir=dlt_working_dir,
+        )
+        logger.debug(
+            "[LOGS PIPELINE] Pipeline created, working directory: {}",
+            pipeline.working_dir,
+        )
+    except Exception as e:
+        logger.error(
+            "[LOGS PIPELINE] Failed to create pipeline: {}: {}",
+            type(e).__name__,
+            e,
+        )
+        raise
+
+    return pipeline
+
 
 def get_pipeline() -> dlt.Pipeline:
     """Get or create the DLT pipeline."""
     global _pipeline
     if _pipeline is None:
-        config = get_config()
+        # Double-checked so concurrent first calls create a single pipeline
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = _create_pipeline()
+    return _pipeline
 
-        # Add debugging for pipeline creation
-        print("[LOGS PIPELINE] Creating new DLT pipeline...")
-        print(f"[LOGS PIPELINE] Pipeline name: {config.pipeline_name}")
-        print(f"[LOGS PIPELINE] Database path: {config.db_path}")
-        print(f"[LOGS PIPELINE] Dataset name: {config.dataset_name}")
 
-        # Ensure directory exists
-        import os
+def reset_pipeline() -> None:
+    """Drop the current pipeline so the next get_pipeline() uses the new config."""
+    global _pipeline
+    with _pipeline_lock:
+        _pipeline = None
 
-        db_dir = os.path.dirname(config.db_path)
-        if db_dir and not os.path.exists(db_dir):
-            print(f"[LOGS PIPELINE] Creating directory: {db_dir}")
-            os.makedirs(db_dir, exist_ok=True)
 
-        try:
-            # Set DLT working directory to be relative to the project root
-            # This ensures .dlt folder is created in the right place
-            dlt_working_dir = os.path.join(config.project_root, ".dlt_pipeline")
-            os.makedirs(dlt_working_dir, exist_ok=True)
-
-            _pipeline = dlt.pipeline(
-                pipeline_name=config.pipeline_name,
-                destination=dlt.destinations.duckdb(
-                    credentials=f"duckdb:///{config.db_path}"
-                ),
-                dataset_name=config.dataset_name,
-                pipelines_dir=dlt_working_dir,
-            )
-            print("[LOGS PIPELINE] Pipeline created successfully")
-            print(f"[LOGS PIPELINE] Pipeline working directory: {_pipeline.working_dir}")
-            print(f"[LOGS PIPELINE] Project root: {config.project_root}")
-        except Exception as e:
-            print(f"[LOGS PIPELINE] Failed to create pipeline: {type(e).__name__}: {str(e)}")
-            raise
-    else:
-        config = get_config()
-        print(f"[LOGS PIPELINE] Using existing pipeline for dataset: {config.dataset_name}")
+def _to_arrow(rows: list[dict[str, Any]]) -> "pa.Table":
+    """Transpose row dicts into a columnar Arrow table.
 
-    return _pipeline
+    dlt loads Arrow tables without normalizing each row, which is several
+    times faster than passing the dicts for large batches.
+    """
+    columns = {name: [row[name] for row in rows] for name in _ARROW_SCHEMA.names}
+    columns["id"] = [str(value) for value in columns["id"]]
+    columns["run_id"] = [str(value) for value in columns["run_id"]]
+    return pa.Table.from_pydict(columns, schema=_ARROW_SCHEMA)
 
 
-def job_logs(log_entries: list[LogEntry]):
-    """DLT resource for job logs with dynamic table name."""
-    config = get_config()
-    
+@cache
+def _job_logs_resource(table_name: str):
+    """Build the job_logs resource definition once per table name."""
+
     @dlt.resource(
-        name=config.table_name,
+        name=table_name,
         write_disposition="append",
         columns=JOB_LOGS_COLUMNS,
         max_table_nesting=0
     )
-    def _job_logs_resource():
-        for entry in log_entries:
-            yield entry.model_dump()
-    
-    return _job_logs_resource()
+    def _job_logs_resource_impl(log_entries):
+        rows = [
+            entry if isinstance(entry, dict) else entry.fast_dict()
+            for entry in log_entries
+        ]
+        # Yield the whole batch as one item so dlt processes it in bulk
+        yield _to_arrow(rows) if _ARROW_SCHEMA is not None else rows
+
+    return _job_logs_resource_impl
+
+
+def job_logs(log_entries: list[Union[LogEntry, dict[str, Any]]]):
+    """DLT resource for job logs with dynamic table name.
+
+    Entries may be LogEntry models or plain row dicts as built by TPLogger.
+    """
+    config = get_config()
+    return _job_logs_resource(config.table_name)(log_entries)
+
+
+def _get_connection(db_path: str) -> duckdb.DuckDBPyConnection:
+    """Return the writer's DuckDB connection, opening it for db_path if needed."""
+    global _connection, _connection_path
+    if _connection is None or _connection_path != db_path:
+        close_connection()
+        _connection = duckdb.connect(db_path)
+        _connection_path = db_path
+    return _connection
+
+
+def close_connection() -> None:
+    """Close the writer's DuckDB connection, if open.
+
+    DuckDB refuses a read-only connection to a file that this process has
+    open read-write, so the writer closes it whenever flush() is called.
+    """
+    global _connection, _connection_path
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+        _connection_path = None
+
+
+def _reset_after_fork() -> None:
+    """Drop locks and connections a forked child inherited from its parent."""
+    global _pipeline_lock, _connection, _connection_path
+    _pipeline_lock = threading.Lock()
+    if _connection is not None:
+        _inherited_connections.append(_connection)
+        _connection = None
+        _connection_path = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _insert_arrow(pipeline: dlt.Pipeline, table: "pa.Table") -> None:
+    """Append an Arrow batch to the job_logs table as one completed load.
+
+    Fills the DLT bookkeeping columns the same way a pipeline run would: one
+    load id for the batch and a unique id per row. The load id is recorded
+    in _dlt_loads in the same transaction, so queries that only read
+    completed loads include these rows.
+    """
+    config = get_config()
+    schema = pipeline.default_schema
+    load_id = str(time.time())
+    conn = _get_connection(config.db_path)
+    conn.register("job_logs_batch", table)
+    try:
+        conn.begin()
+        try:
+            conn.execute(
+                f"""
+                INSERT INTO {config.dataset_name}.{config.table_name} BY NAME
+                SELECT
+                    *,
+                    ? AS _dlt_load_id,
+                    replace(gen_random_uuid()::VARCHAR, '-', '') AS _dlt_id
+                FROM job_logs_batch
+                """,
+                [load_id],
+            )
+            conn.execute(
+                f"""
+                INSERT INTO {config.dataset_name}.{schema.loads_table_name}
+                    (load_id, schema_name, status, inserted_at, schema_version_hash)
+                VALUES (?, ?, 0, now(), ?)
+                """,
+                [load_id, schema.name, schema.version_hash],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    finally:
+        conn.unregister("job_logs_batch")
+
+
+def is_lock_conflict(error: BaseException) -> bool:
+    """Whether a write failed because another connection holds the database.
+
+    DuckDB refuses a read-write connection while this process has the file
+    open read-only, or while another process holds its lock. dlt wraps
+    destination errors, so the whole exception chain is checked.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        message = str(current)
+        if "different configuration" in message or "Could not set lock" in message:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def write_log_batch(log_entries: list[dict[str, Any]]) -> None:
+    """Store a batch of log rows in DuckDB.
+
+    The first batch after the pipeline is created goes through a DLT run,
+    which creates or migrates the job_logs table. After that, if pyarrow is
+    available, batches are inserted directly, skipping the fixed cost of a
+    pipeline run; any failure there falls back to a DLT run.
+
+    If the database is held by another connection (see is_lock_conflict),
+    the error is raised with nothing left pending, so the caller can retry
+    the same batch.
+    """
+    global _direct_insert_pipeline
+    pipeline = get_pipeline()
+    if _ARROW_SCHEMA is not None and _direct_insert_pipeline is pipeline:
+        try:
+            _insert_arrow(pipeline, _to_arrow(log_entries))
+            return
+        except Exception as e:
+            close_connection()
+            if is_lock_conflict(e):
+                raise
+            _direct_insert_pipeline = None
+
+    if pipeline.has_pending_data:
+        # A failed run leaves its load package pending, and run() would load
+        # only that package and ignore this batch. Finish it first, or drop
+        # it if it still fails; its failure was reported when it happened.
+        try:
+            pipeline.run()
+        except Exception as e:
+            if is_lock_conflict(e):
+                raise
+            pipeline.drop_pending_packages()
+
+    try:
+        pipeline.run(job_logs(log_entries))
+    except Exception as e:
+        if is_lock_conflict(e) and pipeline.has_pending_data:
+            # The caller retries the whole batch; don't leave a copy pending
+            pipeline.drop_pending_packages()
+        raise
+    _direct_insert_pipeline = pipeline
@@ -0,0 +1,230 @@
+"""Background writer that batches log rows into DuckDB writes."""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from ..setup import get_config
+from .pipeline import close_connection, is_lock_conflict, write_log_batch
+
+# Rows waiting to be written by the writer thread. SimpleQueue.put takes no
+# Python-level lock, so producers only pay for the append.
+_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+# Queue limits, applied from the config by start_writer()
+_max_queued = 0
+_drop_when_full = False
+_dropped = 0
+
+# Set by the writer after taking rows, to wake producers blocked on a full
+# queue; they also re-check periodically in case a wakeup was missed
+_space_available = threading.Event()
+_BLOCK_POLL_S = 0.05
+
+# Recent write errors, reported to stderr at most once per interval so a
+# broken destination cannot turn every log call into console output
+_errors: "deque[str]" = deque(maxlen=8)
+_ERROR_REPORT_INTERVAL_S = 1.0
+_last_error_report = 0.0
+
+# How long a batch is retried while another connection holds the database,
+# and the first delay between attempts (doubled up to 1s)
+_LOCK_RETRY_S = 10.0
+_LOCK_RETRY_DELAY_S = 0.05
+
+# Writer thread, started by setup_logging() or on the first write
+_thread: Optional[threading.Thread] = None
+_thread_lock = threading.Lock()
+
+# How often flush() checks that the writer thread is still running
+_FLUSH_POLL_S = 0.1
+
+
+class _FlushRequest:
+    """Queued by flush(): ends the current batch and signals once written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+def _drain() -> tuple[list[dict[str, Any]], Optional[_FlushRequest]]:
+    """Collect the next batch of rows for a pipeline run.
+
+    Blocks for the first row, then keeps taking rows until the batch holds
+    config.batch_size rows, config.batch_interval_s has passed since the
+    first row, or a flush() request is reached. The request, if any, is
+    returned so it can be signalled after the batch is written.
+    """
+    batch: list[dict[str, Any]] = []
+    item = _queue.get()
+    # Read the config only once a row arrives: setup_logging() may have
+    # replaced it while the writer was waiting
+    config = get_config()
+    deadline = time.monotonic() + config.batch_interval_s
+    while True:
+        if isinstance(item, _FlushRequest):
+            return batch, item
+        batch.append(item)
+        if len(batch) >= config.batch_size:
+            break
+        # Take rows that are already queued without a timed wait, which
+        # keeps draining a backlog cheap
+        try:
+            item = _queue.get_nowait()
+            continue
+        except queue.Empty:
+            pass
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            item = _queue.get(timeout=timeout)
+        except queue.Empty:
+            break
+    return batch, None
+
+
+def _report_errors() -> None:
+    """Write and clear the buffered write errors."""
+    while _errors:
+        sys.stderr.write(f"DLT logging failed: {_errors.popleft()}\n")
+
+
+def _record_error(message: str) -> None:
+    """Buffer a write error, reporting the buffer if the interval has passed."""
+    global _last_error_report
+    _errors.append(message)
+    now = time.monotonic()
+    if now - _last_error_report >= _ERROR_REPORT_INTERVAL_S:
+        _last_error_report = now
+        _report_errors()
+
+
+def _write_batch(batch: list[dict[str, Any]]) -> None:
+    """Write a batch, retrying while another connection holds the database.
+
+    Readers such as get_database_info() or the Athena transfer only keep
+    the file open briefly, so the batch is retried rather than dropped.
+    """
+    deadline = time.monotonic() + _LOCK_RETRY_S
+    delay = _LOCK_RETRY_DELAY_S
+    while True:
+        try:
+            write_log_batch(batch)
+            return
+        except Exception as e:
+            if not is_lock_conflict(e) or time.monotonic() + delay > deadline:
+                raise
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+def _run() -> None:
+    """Writer loop: one DuckDB write per collected batch."""
+    global _dropped
+    while True:
+        batch, flush_request = _drain()
+        _space_available.set()
+        try:
+            if batch:
+                _write_batch(batch)
+        except Exception as e:
+            _record_error(f"{type(e).__name__}: {e}")
+        finally:
+            # Release the database once idle or flushed: DuckDB refuses
+            # read-only connections in this process while it is open
+            if flush_request is not None or _queue.empty():
+                close_connection()
+            if flush_request is not None:
+                flush_request.done.set()
+        if _dropped:
+            dropped, _dropped = _dropped, 0
+            _record_error(f"queue full, dropped {dropped} log entries")
+
+
+def start_writer() -> None:
+    """Apply queue settings from the current config and start the writer."""
+    global _thread, _max_queued, _drop_when_full
+    config = get_config()
+    _max_queued = config.queue_size
+    _drop_when_full = config.overflow_policy == "drop"
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_run, name="dlt-logger-writer", daemon=True
+            )
+            _thread.start()
+
+
+def write_log_entry(entry: dict[str, Any]) -> None:
+    """Queue a log row for the writer thread and return immediately.
+
+    When the queue is full the row is dropped or the caller waits for
+    space, depending on config.overflow_policy.
+    """
+    global _dropped
+    if _thread is None:
+        start_writer()
+    if _queue.qsize() >= _max_queued:
+        if _drop_when_full:
+            _dropped += 1
+            return
+        while _queue.qsize() >= _max_queued:
+            _space_available.clear()
+            _space_available.wait(_BLOCK_POLL_S)
+    _queue.put(entry)
+
+
+def flush() -> None:
+    """Block until every log row queued before this call has been written.
+
+    The writer also closes its DuckDB connection, so the database can be
+    opened read-only afterwards. It does the same whenever its queue runs
+    empty.
+    """
+    thread = _thread
+    if thread is not None and thread.is_alive():
+        request = _FlushRequest()
+        _queue.put(request)
+        while not request.done.wait(_FLUSH_POLL_S):
+            if not thread.is_alive():
+                return
+
+
+def _shutdown() -> None:
+    """Flush queued rows and report any errors still buffered."""
+    flush()
+    _report_errors()
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own queue and a fresh writer thread.
+
+    Only the forking thread survives fork(), so the inherited writer state
+    refers to a thread that does not exist in the child. Rows queued in the
+    parent stay with the parent.
+    """
+    global _queue, _space_available, _thread, _thread_lock, _dropped
+    global _last_error_report
+    _queue = queue.SimpleQueue()
+    _space_available = threading.Event()
+    _thread = None
+    _thread_lock = threading.Lock()
+    _dropped = 0
+    _errors.clear()
+    _last_error_report = 0.0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+# Flush at interpreter exit before concurrent.futures refuses new work: dlt
+# runs load jobs on thread pools, so a plain atexit hook would run too late.
+# The hook is private to CPython; without it, fall back to atexit
+_register_atexit = getattr(threading, "_register_atexit", None) or atexit.register
+_register_atexit(_shutdown)
@@ -33,6 +33,7 @@ Usage Examples:
         ...     pass
 """
 
+from ..dlt import flush
 from .decorators import log_execution, timed_operation
 from .handlers import setup_console_logging
 from .logger import TPLogger, get_logger, setup_logging
@@ -43,6 +44,7 @@ __all__ = [
     "TPLogger",
     "setup_logging",
     "get_logger",
+    "flush",
     "setup_console_logging",
     "log_execution",
     "timed_operation",
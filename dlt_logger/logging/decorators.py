@@ -5,7 +5,7 @@ from contextlib import contextmanager
 from functools import wraps
 from typing import Any, Callable, Optional
 
-from .logger import TPLogger
+from .logger import TPLogger, get_logger
 
 
 def log_execution(
@@ -14,42 +14,49 @@ def log_execution(
     """Decorator to automatically log function execution with timing."""
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        module_name = func.__module__
+        function_name = func.__name__
+        action_name = action or f"{function_name}_execution"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            module_name = func.__module__
-            function_name = func.__name__
-            action_name = action or f"{function_name}_execution"
-
-            dlt_logger = TPLogger(module_name)
+            # Resolved per call since decoration may precede setup_logging()
+            dlt_logger = get_logger(module_name)
 
-            start_time = time.time()
+            # Skip building the INFO messages when they would be filtered out
+            log_info = dlt_logger.is_enabled_for("INFO")
+            start_ns = time.perf_counter_ns()
             try:
-                dlt_logger.info(
-                    f"Starting {action_name}",
-                    action=action_name,
-                    function_name=function_name,
-                    success=True,
-                )
+                if log_info:
+                    dlt_logger.info(
+                        f"Starting {action_name}",
+                        action=action_name,
+                        function_name=function_name,
+                        success=True,
+                    )
 
                 result = func(*args, **kwargs)
 
-                duration_ms = int((time.time() - start_time) * 1000)
-                dlt_logger.info(
-                    f"Completed {action_name} in {duration_ms}ms",
-                    action=action_name,
-                    function_name=function_name,
-                    success=True,
-                    duration_ms=duration_ms,
-                )
+                if log_info:
+                    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                    dlt_logger.info(
+                        f"Completed {action_name} in {duration_ms}ms",
+                        action=action_name,
+                        function_name=function_name,
+                        success=True,
+                        duration_ms=duration_ms,
+                    )
 
                 return result
 
             except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
-                dlt_logger.log_exception(action_name, e)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 dlt_logger._log(
                     level="ERROR",
-                    message=f"Failed {action_name} after {duration_ms}ms",
+                    message=(
+                        f"Failed {action_name} after {duration_ms}ms: "
+                        f"{type(e).__name__}: {e}"
+                    ),
                     action=action_name,
                     function_name=function_name,
                     success=False,
@@ -65,24 +72,26 @@ def log_execution(
 @contextmanager
 def timed_operation(dlt_logger: TPLogger, action: str, **log_kwargs):
     """Context manager for timing operations."""
-    start_time = time.time()
+    log_info = dlt_logger.is_enabled_for("INFO")
+    start_ns = time.perf_counter_ns()
     try:
-        dlt_logger.info(f"Starting {action}", action=action, **log_kwargs)
+        if log_info:
+            dlt_logger.info(f"Starting {action}", action=action, **log_kwargs)
         yield
-        duration_ms = int((time.time() - start_time) * 1000)
-        dlt_logger.info(
-            f"Completed {action} in {duration_ms}ms",
-            action=action,
-            success=True,
-            duration_ms=duration_ms,
-            **log_kwargs,
-        )
+        if log_info:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            dlt_logger.info(
+                f"Completed {action} in {duration_ms}ms",
+                action=action,
+                success=True,
+                duration_ms=duration_ms,
+                **log_kwargs,
+            )
     except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        dlt_logger.log_exception(action, e)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         dlt_logger._log(
             level="ERROR",
-            message=f"Failed {action} after {duration_ms}ms",
+            message=f"Failed {action} after {duration_ms}ms: {type(e).__name__}: {e}",
             action=action,
             success=False,
             duration_ms=duration_ms,
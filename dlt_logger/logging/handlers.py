@@ -7,22 +7,37 @@ from loguru import logger
 
 from ..setup import get_config
 
+# Library diagnostics stay quiet until setup_console_logging() installs a
+# handler at the configured level; loguru's default stderr handler would
+# otherwise print them at DEBUG
+logger.disable("dlt_logger")
+
 
 class InterceptHandler(logging.Handler):
     """Handler to intercept standard logging and redirect to loguru."""
 
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        # Loguru depth per call site: the stack between a given logging call
+        # and emit() is always the same, so it is only walked once
+        self._depths: dict[tuple[str, int], int] = {}
+
     def emit(self, record):
         try:
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno
 
-        frame, depth = sys._getframe(6), 6
-        while frame and depth > 0:
-            if frame.f_code.co_filename != logging.__file__:
-                break
-            frame = frame.f_back
-            depth -= 1
+        call_site = (record.pathname, record.lineno)
+        depth = self._depths.get(call_site)
+        if depth is None:
+            frame, depth = logging.currentframe(), 0
+            while frame and (
+                depth == 0 or frame.f_code.co_filename == logging.__file__
+            ):
+                frame = frame.f_back
+                depth += 1
+            self._depths[call_site] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
@@ -34,6 +49,7 @@ def setup_console_logging():
     config = get_config()
 
     if not config.console_logging:
+        logger.disable("dlt_logger")
         return
 
     # Configure loguru
@@ -45,6 +61,7 @@ def setup_console_logging():
         "<level>{message}</level>"
     )
     logger.add(sys.stdout, format=log_format, level=config.log_level)
+    logger.enable("dlt_logger")
 
     # Setup intercept handler for standard logging
     root_logger = logging.getLogger()
@@ -1,13 +1,62 @@
 """Core TPLogger class for dlt-logger."""
 
-from typing import Literal, Optional
+from datetime import datetime, timezone
+from functools import cache
+from typing import Any, Literal, Optional
 
 from loguru import logger
 
-from ..dlt import RUN_ID, get_pipeline, job_logs
+from ..dlt import (
+    RUN_ID,
+    flush,
+    get_pipeline,
+    reset_pipeline,
+    start_writer,
+    write_log_entry,
+)
 from ..setup import LoggerConfig, get_config, set_config
 from .handlers import setup_console_logging
-from .models import LogEntry
+from .models import new_log_id
+
+# String values accepted for boolean fields, as the LogEntry model accepts them
+_BOOL_STRINGS = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "yes": True,
+    "no": False,
+}
+
+
+def _coerce_field(name: str, value: Any, expected: type) -> Any:
+    """Convert a log field value to its column type, or raise ValueError."""
+    if expected is int and not isinstance(value, bool):
+        try:
+            if isinstance(value, int):
+                return int(value)
+            if isinstance(value, float) and value.is_integer():
+                return int(value)
+            if isinstance(value, str):
+                return int(value.strip())
+        except ValueError:
+            pass
+    elif expected is bool:
+        if isinstance(value, int) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in _BOOL_STRINGS:
+            return _BOOL_STRINGS[value.strip().lower()]
+    elif expected is str and isinstance(value, str):
+        return str(value)
+    raise ValueError(
+        f"Invalid value for {name}: {value!r} (expected {expected.__name__})"
+    )
+
+
+@cache
+def _bound_logger(module_name: str):
+    """Loguru logger bound to a module name, shared by its TPLogger instances."""
+    return logger.bind(name=module_name)
 
 
 class TPLogger:
@@ -30,58 +79,108 @@ class TPLogger:
         ...                   success=True, duration_ms=250)
     """
 
+    # Log level to loguru method name, resolved once per instance
+    _LEVEL_DISPATCH = {
+        "DEBUG": "debug",
+        "INFO": "info",
+        "WARNING": "warning",
+        "ERROR": "error",
+        "CRITICAL": "critical",
+    }
+
+    # Numeric severities matching the standard logging module
+    _LEVEL_NUM = {
+        "DEBUG": 10,
+        "INFO": 20,
+        "WARNING": 30,
+        "ERROR": 40,
+        "CRITICAL": 50,
+    }
+
+    # Optional columns that logging calls may set through **kwargs, with the
+    # type each one is stored as
+    _FIELD_TYPES = {
+        "action": str,
+        "function_name": str,
+        "success": bool,
+        "status_code": int,
+        "duration_ms": int,
+        "request_method": str,
+    }
+
     def __init__(self, module_name: str):
         self.module_name = module_name
         self.config = get_config()
         self.pipeline = get_pipeline()
-        self.loguru_logger = logger.bind(name=module_name)
+        self.loguru_logger = _bound_logger(module_name)
+        self._project_name = self.config.project_name
+        self._run_id = RUN_ID
+        self._min_level_num = self._LEVEL_NUM.get(self.config.log_level, 0)
+        self._level_fns = {
+            level: getattr(self.loguru_logger, method)
+            for level, method in self._LEVEL_DISPATCH.items()
+        }
 
     def _create_log_entry(
         self,
         level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         message: str,
-        action: Optional[str] = None,
-        function_name: Optional[str] = None,
-        success: Optional[bool] = None,
-        status_code: Optional[int] = None,
-        duration_ms: Optional[int] = None,
-        request_method: Optional[str] = None,
-    ) -> LogEntry:
-        """Create a LogEntry model."""
-        return LogEntry(
-            project_name=self.config.project_name,
-            module_name=self.module_name,
-            function_name=function_name,
-            run_id=RUN_ID,
-            level=level,
-            action=action,
-            message=message,
-            success=success,
-            status_code=status_code,
-            duration_ms=duration_ms,
-            request_method=request_method,
-        )
+        fields: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Create a job_logs row as a plain dict.
 
-    def _log_to_dlt(self, log_entry: LogEntry):
-        """Log entry using DLT."""
-        try:
-            # Run the pipeline with the log entry
-            self.pipeline.run(job_logs([log_entry]))
-        except Exception as e:
-            print(f"DLT logging failed: {e}")
-
-    def _validate_kwargs(self, **kwargs):
-        """Validate that kwargs only contain valid LogEntry fields."""
-        valid_fields = {
-            'action', 'function_name', 'success', 'status_code', 
-            'duration_ms', 'request_method'
+        fields holds the optional columns passed to the logging call, already
+        checked by _validate_kwargs. The row shape is fixed by the resource
+        column hints, so the LogEntry model validation is skipped here.
+        """
+        row = {
+            "id": new_log_id(),
+            "project_name": self._project_name,
+            "module_name": self.module_name,
+            "function_name": None,
+            "run_id": self._run_id,
+            "timestamp": datetime.now(timezone.utc),
+            "level": level,
+            "action": None,
+            "message": message,
+            "success": None,
+            "status_code": None,
+            "duration_ms": None,
+            "request_method": None,
         }
-        
-        invalid_fields = set(kwargs.keys()) - valid_fields
+        if fields:
+            row.update(fields)
+        return row
+
+    def is_enabled_for(
+        self, level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    ) -> bool:
+        """Whether entries at this level pass the configured log level.
+
+        Lets callers skip formatting messages that would be discarded.
+        """
+        return self._LEVEL_NUM[level] >= self._min_level_num
+
+    def _log_to_dlt(self, log_entry: dict[str, Any]):
+        """Queue log entry for the background DLT writer."""
+        write_log_entry(log_entry)
+
+    def _validate_kwargs(self, fields: dict[str, Any]):
+        """Validate fields against the LogEntry columns, coercing in place.
+
+        Values are converted the way the LogEntry model would (e.g. "200" for
+        status_code); anything else raises ValueError here rather than
+        failing the writer's whole batch later.
+        """
+        invalid_fields = fields.keys() - self._FIELD_TYPES.keys()
         if invalid_fields:
             raise ValueError(f"Invalid log parameters: {invalid_fields}. "
-                           f"Only these fields are allowed: {valid_fields}")
-    
+                           f"Only these fields are allowed: {set(self._FIELD_TYPES)}")
+        for name, value in fields.items():
+            expected = self._FIELD_TYPES[name]
+            if value is not None and type(value) is not expected:
+                fields[name] = _coerce_field(name, value, expected)
+
     def _log(
         self,
         level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -89,15 +188,25 @@ class TPLogger:
         **kwargs,
     ):
         """Internal logging method."""
+        # Skip entries below the configured level before doing any work
+        if self._LEVEL_NUM[level] < self._min_level_num:
+            return
+
+        if not isinstance(message, str):
+            raise ValueError(
+                f"Invalid log message: expected str, got {type(message).__name__}"
+            )
+
         # Validate kwargs to prevent invalid fields like 'context'
-        self._validate_kwargs(**kwargs)
-        
+        if kwargs:
+            self._validate_kwargs(kwargs)
+
         # Console logging
         if self.config.console_logging:
-            getattr(self.loguru_logger, level.lower())(message)
+            self._level_fns[level](message)
 
         # Create log entry and store via DLT
-        log_entry = self._create_log_entry(level=level, message=message, **kwargs)
+        log_entry = self._create_log_entry(level, message, kwargs)
         self._log_to_dlt(log_entry)
 
     def debug(self, message: str, **kwargs):
@@ -186,6 +295,15 @@ def setup_logging(**kwargs):
         table_name (str): Table name within the dataset. Required.
         db_path (str, optional): Path to DuckDB file. Defaults to "./logs/app.duckdb".
         console_logging (bool, optional): Enable console output. Defaults to True.
+        batch_size (int, optional): Maximum log entries per DLT pipeline run.
+            Defaults to 1000.
+        batch_interval_s (float, optional): Maximum seconds an entry waits for
+            its batch to fill before being written. Defaults to 1.0.
+        queue_size (int, optional): Maximum log entries waiting to be written.
+            Defaults to 100000.
+        overflow_policy (str, optional): What logging calls do when the queue
+            is full: "block" until there is space, or "drop" the entry.
+            Defaults to "block".
         athena_destination (bool, optional): Enable AWS Athena integration.
             Defaults to False.
         aws_region (str, optional): AWS region for Athena.
@@ -200,7 +318,7 @@ def setup_logging(**kwargs):
 
     Raises:
         ValueError: If required Athena parameters are missing when
-            athena_destination=True.
+            athena_destination=True, or batch settings are out of range.
 
     Example:
         >>> setup_logging(
@@ -215,23 +333,32 @@ def setup_logging(**kwargs):
     """
     # Create configuration using the config module with provided parameters
     config = LoggerConfig(**kwargs)
+
+    # Write rows queued under the previous config to its database first
+    flush()
     set_config(config)
 
     # Reset pipeline to use new config
-    import dlt_logger.dlt.pipeline as pipeline_module
+    reset_pipeline()
+
+    # Cached loggers hold the previous config and pipeline
+    get_logger.cache_clear()
 
-    pipeline_module._pipeline = None
+    # Start the background DLT writer with the new queue settings
+    start_writer()
 
-    # Setup console logging
-    if config.console_logging:
-        setup_console_logging()
+    # Setup console logging; without it, library diagnostics stay disabled
+    setup_console_logging()
 
 
+@cache
 def get_logger(name: str) -> TPLogger:
     """Get a TPLogger instance for the specified module.
 
-    Creates a new TPLogger instance bound to the given module name.
-    The logger will use the global configuration set by setup_logging().
+    Returns a TPLogger bound to the given module name, reusing the same
+    instance for repeated calls with the same name. The logger will use the
+    global configuration set by setup_logging(); calling setup_logging()
+    again discards cached instances.
 
     Args:
         name (str): Module or component name for the logger.
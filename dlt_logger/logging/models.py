@@ -1,16 +1,40 @@
 """Pydantic models for tp-logger data structures."""
 
+import os
 from datetime import datetime
+from itertools import count
 from typing import Any, Literal, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+# Log entry ids: random high 64 bits per process, a counter in the low 64.
+# Unique without reading os.urandom for every entry, and ordered by creation
+# within a process.
+_LOG_ID_BASE = uuid4().int & ~((1 << 64) - 1)
+_log_id_counter = count()
+
+
+def new_log_id() -> UUID:
+    """Return a new log entry id (a valid version 4 UUID)."""
+    return UUID(int=_LOG_ID_BASE | next(_log_id_counter), version=4)
+
+
+def _reseed_log_ids() -> None:
+    """Give a forked child its own id base so it cannot repeat parent ids."""
+    global _LOG_ID_BASE, _log_id_counter
+    _LOG_ID_BASE = uuid4().int & ~((1 << 64) - 1)
+    _log_id_counter = count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_log_ids)
+
 
 class LogEntry(BaseModel):
     """Model for a log entry matching the job_logs table schema."""
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=new_log_id)
     project_name: str
     module_name: Optional[str] = None
     function_name: Optional[str] = None
@@ -24,6 +48,28 @@ class LogEntry(BaseModel):
     duration_ms: Optional[int] = None
     request_method: Optional[str] = None
 
+    def fast_dict(self) -> dict[str, Any]:
+        """Return the fields as a flat dict, like model_dump() for this schema.
+
+        Built directly from the attributes, skipping pydantic's generic
+        serializer; used when converting entries to job_logs rows.
+        """
+        return {
+            "id": self.id,
+            "project_name": self.project_name,
+            "module_name": self.module_name,
+            "function_name": self.function_name,
+            "run_id": self.run_id,
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "action": self.action,
+            "message": self.message,
+            "success": self.success,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "request_method": self.request_method,
+        }
+
     class Config:
         """Pydantic configuration."""
 
@@ -18,6 +18,10 @@ class LoggerConfig:
         table_name: str,
         db_path: Optional[str] = None,
         console_logging: bool = True,
+        batch_size: int = 1000,
+        batch_interval_s: float = 1.0,
+        queue_size: int = 100_000,
+        overflow_policy: str = "block",
         sync_to_s3: bool = False,
         aws_s3_bucket: Optional[str] = None,
         aws_s3_key_prefix: str = "logs/",
@@ -31,6 +35,10 @@ class LoggerConfig:
         self.project_name = project_name
         self.log_level = log_level.upper()
         self.console_logging = console_logging
+        self.batch_size = batch_size
+        self.batch_interval_s = batch_interval_s
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
         self.pipeline_name = pipeline_name
         self.dataset_name = dataset_name
         self.table_name = table_name
@@ -54,6 +62,16 @@ class LoggerConfig:
             db_path = "./logs/app.duckdb"
         self.db_path = resolve_project_path(db_path, self.project_root)
 
+        # Validate batching configuration
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.batch_interval_s < 0:
+            raise ValueError("batch_interval_s must not be negative")
+        if self.queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if self.overflow_policy not in ("block", "drop"):
+            raise ValueError('overflow_policy must be "block" or "drop"')
+
         # Validate S3 configuration
         if self.sync_to_s3 and not self.aws_s3_bucket:
             raise ValueError("aws_s3_bucket is required when sync_to_s3=True")
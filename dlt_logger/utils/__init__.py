@@ -15,11 +15,15 @@ Usage Examples:
         >>> print(format_duration(65000))  # "1m 5.00s"
 
     Sample data generation:
-        >>> from dlt_logger.utils import generate_sample_log_data
+        >>> from dlt_logger.utils import generate_sample_log_data, iter_sample_log_data
         >>>
         >>> sample_logs = generate_sample_log_data(count=5)
         >>> for log in sample_logs:
         ...     print(f"{log['action']}: {log['message']}")
+        >>>
+        >>> # Or stream entries without building the whole list
+        >>> for log in iter_sample_log_data(count=100_000):
+        ...     process(log)
 
     Database inspection:
         >>> from dlt_logger.utils import get_database_info_from_config
@@ -35,9 +39,11 @@ from .helpers import (
     ensure_directory_exists,
     find_project_root_from_path,
     format_duration,
+    generate_sample_arrow,
     generate_sample_log_data,
     get_database_info,
     get_database_info_from_config,
+    iter_sample_log_data,
     resolve_project_path,
 )
 
@@ -46,8 +52,10 @@ __all__ = [
     "ensure_directory_exists",
     "find_project_root_from_path",
     "format_duration",
+    "generate_sample_arrow",
     "generate_sample_log_data",
     "get_database_info",
     "get_database_info_from_config",
+    "iter_sample_log_data",
     "resolve_project_path",
 ]
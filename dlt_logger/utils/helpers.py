@@ -1,16 +1,35 @@
 """Utility functions and helpers for tp-logger."""
 
+import copy
 import inspect
 import os
+import random
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional
 
+import duckdb
+
+try:
+    import pyarrow as pa
+except ImportError:  # Optional: installed with the athena extra
+    pa = None
+
+# Directories already created or found by ensure_directory_exists()
+_known_directories: set[str] = set()
+
 
 def ensure_directory_exists(path: str) -> None:
-    """Ensure a directory exists, creating it if necessary."""
+    """Ensure a directory exists, creating it if necessary.
+
+    Each directory is checked once per process; a directory removed after
+    that is not recreated.
+    """
     directory = os.path.dirname(path)
-    if directory and not os.path.exists(directory):
+    if directory and directory not in _known_directories:
         os.makedirs(directory, exist_ok=True)
+        _known_directories.add(directory)
 
 
 def format_duration(duration_ms: Optional[int]) -> str:
@@ -20,15 +39,36 @@ def format_duration(duration_ms: Optional[int]) -> str:
 
     if duration_ms < 1000:
         return f"{duration_ms}ms"
-    elif duration_ms < 60000:
+    if duration_ms < 60000:
         return f"{duration_ms / 1000:.2f}s"
-    else:
-        minutes = duration_ms // 60000
-        seconds = (duration_ms % 60000) / 1000
-        return f"{minutes}m {seconds:.2f}s"
+    minutes, remainder_ms = divmod(duration_ms, 60000)
+    return f"{minutes}m {remainder_ms / 1000:.2f}s"
+
 
 
 
+_SAMPLE_ACTIONS = (
+    "user_login",
+    "data_fetch",
+    "file_upload",
+    "api_call",
+    "database_query",
+)
+
+# (success, level) outcomes for sample rows: half fail at ERROR, the other
+# half succeed at one of four levels
+_SAMPLE_OUTCOMES = (
+    (True, "INFO"),
+    (True, "WARNING"),
+    (True, "ERROR"),
+    (True, "DEBUG"),
+    (False, "ERROR"),
+)
+_SAMPLE_OUTCOME_WEIGHTS = (1, 1, 1, 1, 4)
+
+# Rows sampled per batch of random draws in iter_sample_log_data()
+_SAMPLE_CHUNK_SIZE = 4096
+
 
 def generate_sample_log_data(count: int = 10) -> list[dict[str, Any]]:
     """Generate sample log data for testing and demonstration purposes.
@@ -55,34 +95,106 @@ def generate_sample_log_data(count: int = 10) -> list[dict[str, Any]]:
         data_fetch: False
         file_upload: True
     """
-    import random
-    from uuid import uuid4
-
-    actions = ["user_login", "data_fetch", "file_upload", "api_call", "database_query"]
-    statuses = [True, False]
-    levels = ["INFO", "WARNING", "ERROR", "DEBUG"]
-
-    sample_data = []
-    for _i in range(count):
-        action = random.choice(actions)
-        success = random.choice(statuses)
-        level = "ERROR" if not success else random.choice(levels)
-
-        data = {
-            "action": action,
-            "message": f"Sample {action} operation "
-            f"{'succeeded' if success else 'failed'}",
-            "success": success,
-            "level": level,
-            "duration_ms": random.randint(50, 5000),
+    return list(iter_sample_log_data(count))
+
+
+def iter_sample_log_data(count: int = 10) -> Iterator[dict[str, Any]]:
+    """Yield sample log data one entry at a time.
+
+    Same entries as generate_sample_log_data(), without holding them all in
+    memory. Random values are drawn in chunks of _SAMPLE_CHUNK_SIZE rows.
+
+    Args:
+        count (int, optional): Number of sample log entries to yield. Defaults to 10.
+
+    Yields:
+        dict: Sample log entry with action, message, success, level and
+            duration_ms keys.
+    """
+    remaining = count
+    while remaining > 0:
+        chunk = min(remaining, _SAMPLE_CHUNK_SIZE)
+        remaining -= chunk
+
+        # Draw each column in one call rather than several RNG calls per row
+        sampled_actions = random.choices(_SAMPLE_ACTIONS, k=chunk)
+        sampled_outcomes = random.choices(
+            _SAMPLE_OUTCOMES, weights=_SAMPLE_OUTCOME_WEIGHTS, k=chunk
+        )
+        sampled_durations = random.choices(range(50, 5001), k=chunk)
+
+        for action, (success, level), duration_ms in zip(
+            sampled_actions, sampled_outcomes, sampled_durations
+        ):
+            yield {
+                "action": action,
+                "message": f"Sample {action} operation "
+                f"{'succeeded' if success else 'failed'}",
+                "success": success,
+                "level": level,
+                "duration_ms": duration_ms,
+            }
+
+
+def generate_sample_arrow(count: int = 10) -> "pa.Table":
+    """Generate sample log data as a columnar Arrow table.
+
+    Same columns and distribution as generate_sample_log_data(), built
+    column by column without per-row dicts. The table can be registered on
+    a DuckDB connection and inserted with a single statement.
+
+    Args:
+        count (int, optional): Number of sample log entries. Defaults to 10.
+
+    Returns:
+        pyarrow.Table: Columns action and level (dictionary-encoded strings),
+            message (string), success (bool) and duration_ms (int32).
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Example:
+        >>> table = generate_sample_arrow(count=10_000)
+        >>> conn.register("samples", table)
+        >>> conn.execute("INSERT INTO sample_logs SELECT * FROM samples")
+    """
+    if pa is None:
+        raise ImportError(
+            "generate_sample_arrow requires pyarrow: pip install dlt-logger[athena]"
+        )
+
+    actions = random.choices(_SAMPLE_ACTIONS, k=count)
+    outcomes = random.choices(
+        _SAMPLE_OUTCOMES, weights=_SAMPLE_OUTCOME_WEIGHTS, k=count
+    )
+    successes = [success for success, _ in outcomes]
+    messages = [
+        f"Sample {action} operation {'succeeded' if success else 'failed'}"
+        for action, success in zip(actions, successes)
+    ]
+
+    return pa.table(
+        {
+            "action": pa.array(actions, pa.string()).dictionary_encode(),
+            "message": pa.array(messages, pa.string()),
+            "success": pa.array(successes, pa.bool_()),
+            "level": pa.array(
+                [level for _, level in outcomes], pa.string()
+            ).dictionary_encode(),
+            "duration_ms": pa.array(
+                random.choices(range(50, 5001), k=count), pa.int32()
+            ),
         }
-        sample_data.append(data)
+    )
 
-    return sample_data
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQL identifier for DuckDB."""
+    return '"' + name.replace('"', '""') + '"'
 
 
 def get_database_info(
-    db_path: str, dataset_name: str, table_name: str = "job_logs"
+    db_path: str, dataset_name: str, table_name: str = "job_logs", exact: bool = False
 ) -> dict[str, Any]:
     """Get information about the DuckDB database.
 
@@ -90,34 +202,63 @@ def get_database_info(
         db_path: Path to the DuckDB database file
         dataset_name: Schema/dataset name to query (from config)
         table_name: Name of the logs table (configurable)
+        exact: Count rows with a full scan instead of reading the row count
+            from DuckDB's catalog. The catalog count is exact for the
+            append-only logs table; use this if rows are deleted elsewhere.
     """
-    import duckdb
+    # One stat() for both the existence check and the file size
+    try:
+        file_size_mb = round(os.stat(db_path).st_size / (1024 * 1024), 2)
+        exists = True
+    except FileNotFoundError:
+        # Nothing to inspect; skip opening DuckDB just to have it fail
+        return {
+            "database_path": db_path,
+            "dataset_name": dataset_name,
+            "table_name": table_name,
+            "exists": False,
+            "tables": [],
+            "file_size_mb": 0,
+        }
+    except OSError:
+        file_size_mb = 0
+        exists = False
 
     try:
         with duckdb.connect(db_path, read_only=True) as conn:
-            # Get table info using the configurable dataset name
-            tables_query = (
-                f"SELECT table_name FROM information_schema.tables "
-                f"WHERE table_schema = '{dataset_name}'"
-            )
-            tables = conn.execute(tables_query).fetchall()
+            # Table names and their catalog row counts in one query
+            tables = conn.execute(
+                "SELECT t.table_name, d.estimated_size "
+                "FROM information_schema.tables t "
+                "LEFT JOIN duckdb_tables() d "
+                "ON d.database_name = t.table_catalog "
+                "AND d.schema_name = t.table_schema "
+                "AND d.table_name = t.table_name "
+                "WHERE t.table_schema = ?",
+                [dataset_name],
+            ).fetchall()
+            row_counts = dict(tables)
 
             info = {
                 "database_path": db_path,
                 "dataset_name": dataset_name,
                 "table_name": table_name,
-                "exists": os.path.exists(db_path),
-                "tables": [table[0] for table in tables] if tables else [],
-                "file_size_mb": round(os.path.getsize(db_path) / (1024 * 1024), 2)
-                if os.path.exists(db_path)
-                else 0,
+                "exists": exists,
+                "tables": list(row_counts),
+                "file_size_mb": file_size_mb,
             }
 
             # Get row count if the specified table exists
-            if table_name in info["tables"]:
-                count_query = f"SELECT COUNT(*) FROM {dataset_name}.{table_name}"
-                count = conn.execute(count_query).fetchone()[0]
-                info["total_logs"] = count
+            if table_name in row_counts:
+                if exact:
+                    # Identifiers cannot be bound as parameters; both names
+                    # are known to exist at this point and are quoted
+                    info["total_logs"] = conn.execute(
+                        f"SELECT COUNT(*) FROM {_quote_identifier(dataset_name)}."
+                        f"{_quote_identifier(table_name)}"
+                    ).fetchone()[0]
+                else:
+                    info["total_logs"] = row_counts[table_name]
 
             return info
 
@@ -126,24 +267,47 @@ def get_database_info(
             "database_path": db_path,
             "dataset_name": dataset_name,
             "table_name": table_name,
-            "exists": os.path.exists(db_path),
+            "exists": exists,
             "error": str(e),
-            "file_size_mb": round(os.path.getsize(db_path) / (1024 * 1024), 2)
-            if os.path.exists(db_path)
-            else 0,
+            "file_size_mb": file_size_mb,
         }
 
 
-def get_database_info_from_config() -> dict[str, Any]:
-    """Get database info using values from the current configuration."""
+# Recent get_database_info_from_config() results: key -> (monotonic time, info)
+_info_cache: dict[tuple[str, str, bool], tuple[float, dict[str, Any]]] = {}
+
+
+def get_database_info_from_config(
+    exact: bool = False, max_age_s: float = 0.0
+) -> dict[str, Any]:
+    """Get database info using values from the current configuration.
+
+    See get_database_info() for the meaning of exact.
+
+    Args:
+        exact: Count rows with a full scan instead of the catalog count.
+        max_age_s: Reuse a result for the same database and dataset if it is
+            at most this many seconds old, e.g. for dashboards polling this
+            function. Defaults to 0, which always queries the database.
+    """
     from ..setup import get_config
 
     config = get_config()
-    return get_database_info(
+    key = (config.db_path, config.dataset_name, exact)
+    if max_age_s > 0:
+        cached = _info_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= max_age_s:
+            # Deep copy: callers may mutate the nested tables list
+            return copy.deepcopy(cached[1])
+
+    info = get_database_info(
         db_path=config.db_path,
         dataset_name=config.dataset_name,
         table_name="job_logs",  # Could be made configurable in LoggerConfig
+        exact=exact,
     )
+    _info_cache[key] = (time.monotonic(), info)
+    return copy.deepcopy(info)
 
 
 def detect_project_root(caller_frame_depth: int = 3) -> str:
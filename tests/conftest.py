@@ -0,0 +1,50 @@
+"""Shared fixtures: each test logs to its own DuckDB file and DLT pipeline."""
+
+import uuid
+
+import duckdb
+import pytest
+
+import dlt_logger
+from dlt_logger.setup import get_config
+
+
+@pytest.fixture
+def configure(tmp_path):
+    """Return a function that calls setup_logging() for a database in tmp_path.
+
+    Keyword arguments override the defaults; ``name`` picks the database
+    file, so one test can configure several databases.
+    """
+
+    def _configure(name: str = "logs", **overrides):
+        settings = {
+            "project_name": "tests",
+            "log_level": "INFO",
+            "pipeline_name": f"test_{uuid.uuid4().hex[:12]}",
+            "dataset_name": "test_logs",
+            "table_name": "job_logs",
+            "db_path": str(tmp_path / f"{name}.duckdb"),
+            "console_logging": False,
+            "project_root": str(tmp_path),
+        }
+        settings.update(overrides)
+        dlt_logger.setup_logging(**settings)
+        return get_config()
+
+    yield _configure
+    dlt_logger.flush()
+
+
+@pytest.fixture
+def query():
+    """Return a function that runs a query on a database opened read-only."""
+
+    def _query(db_path: str, sql: str) -> list[tuple]:
+        conn = duckdb.connect(db_path, read_only=True)
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    return _query
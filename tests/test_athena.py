@@ -0,0 +1,38 @@
+"""Tests for the Athena transfer, run against a local DuckDB destination."""
+
+import dlt
+import pytest
+
+import dlt_logger
+from dlt_logger.dlt import transfer_logs_to_athena
+
+pytest.importorskip("pyarrow")
+
+
+def test_transfer_keeps_dlt_columns(configure, query, tmp_path, monkeypatch):
+    destination = str(tmp_path / "athena.duckdb")
+    monkeypatch.setenv("DLT_DATA_DIR", str(tmp_path / "dlt"))
+
+    def local_athena(**kwargs):
+        return dlt.destinations.duckdb(destination)
+
+    monkeypatch.setattr(dlt.destinations, "athena", local_athena)
+    configure(
+        athena_destination=True,
+        aws_region="eu-west-1",
+        athena_database="logs",
+        athena_s3_staging_bucket="s3://staging",
+    )
+    logger = dlt_logger.get_logger("tests")
+    for i in range(3):
+        logger.info(f"row {i}")
+
+    assert transfer_logs_to_athena()
+
+    rows = query(
+        destination,
+        "SELECT count(*), count(_dlt_load_id), count(DISTINCT _dlt_id) "
+        "FROM test_logs.job_logs WHERE message LIKE 'row %'",
+    )
+    assert rows == [(3, 3, 3)]
+    assert dlt.config.get("data_writer.compression") is None
@@ -0,0 +1,20 @@
+"""Tests for the database info helpers."""
+
+import dlt_logger
+from dlt_logger.dlt import flush
+from dlt_logger.utils import get_database_info_from_config
+
+
+def test_cached_database_info_is_not_shared(configure):
+    configure()
+    dlt_logger.get_logger("tests").info("row")
+    flush()
+
+    first = get_database_info_from_config(max_age_s=60)
+    assert first["total_logs"] == 1
+    first["tables"].append("changed")
+
+    second = get_database_info_from_config(max_age_s=60)
+    assert "changed" not in second["tables"]
+    second["tables"].clear()
+    assert get_database_info_from_config(max_age_s=60)["tables"]
@@ -0,0 +1,70 @@
+"""Tests for TPLogger field handling and reconfiguration."""
+
+from http import HTTPStatus
+
+import pytest
+from loguru import logger
+
+import dlt_logger
+from dlt_logger.dlt import flush
+
+
+def test_optional_fields_are_coerced(configure, query):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    logger.info("strings", status_code="200", duration_ms=12.0, success="true")
+    logger.info("enum", status_code=HTTPStatus.NOT_FOUND, success=0)
+    flush()
+
+    rows = query(
+        config.db_path,
+        "SELECT message, status_code, duration_ms, success "
+        "FROM test_logs.job_logs ORDER BY 1",
+    )
+    assert rows == [("enum", 404, None, False), ("strings", 200, 12, True)]
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"status_code": "abc"},
+        {"duration_ms": 1.5},
+        {"success": "maybe"},
+        {"action": 5},
+        {"unknown": "x"},
+    ],
+)
+def test_invalid_fields_raise(configure, fields):
+    configure()
+    with pytest.raises(ValueError):
+        dlt_logger.get_logger("tests").info("bad", **fields)
+
+
+def test_non_string_message_raises(configure):
+    configure()
+    with pytest.raises(ValueError):
+        dlt_logger.get_logger("tests").info(123)
+
+
+def test_queued_rows_stay_with_their_config(configure, query):
+    config_a = configure(name="a", batch_interval_s=30)
+    dlt_logger.get_logger("tests").info("for a")
+    config_b = configure(name="b", batch_interval_s=30)
+    dlt_logger.get_logger("tests").info("for b")
+    flush()
+
+    sql = "SELECT message FROM test_logs.job_logs"
+    assert query(config_a.db_path, sql) == [("for a",)]
+    assert query(config_b.db_path, sql) == [("for b",)]
+
+
+def test_pipeline_diagnostics_respect_disabled_console(configure):
+    messages = []
+    sink = logger.add(messages.append, level="DEBUG")
+    try:
+        configure(log_level="INFO", console_logging=False)
+        dlt_logger.get_logger("tests")
+    finally:
+        logger.remove(sink)
+
+    assert not [m for m in messages if "[LOGS PIPELINE]" in m]
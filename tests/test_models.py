@@ -0,0 +1,34 @@
+"""Tests for log entry ids."""
+
+import os
+
+import pytest
+
+from dlt_logger.logging.models import new_log_id
+
+
+def test_log_ids_are_unique_version_4_uuids():
+    ids = [new_log_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert all(log_id.version == 4 for log_id in ids)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_children_generate_their_own_ids():
+    new_log_id()
+    read_fd, write_fd = os.pipe()
+    children = []
+    for _ in range(3):
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, f"{new_log_id()}\n".encode())
+            os._exit(0)
+        children.append(pid)
+    for pid in children:
+        os.waitpid(pid, 0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        ids = pipe.read().split()
+
+    ids.append(str(new_log_id()))
+    assert len(set(ids)) == 4
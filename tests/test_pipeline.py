@@ -0,0 +1,153 @@
+"""Tests for storing batches: DLT runs, direct inserts and their fallbacks."""
+
+import threading
+import time
+
+import duckdb
+import pytest
+
+import dlt_logger
+from dlt_logger.dlt import flush, get_pipeline
+from dlt_logger.dlt import pipeline as pipeline_module
+from dlt_logger.dlt.pipeline import job_logs
+
+pytest.importorskip("pyarrow")
+
+COUNTS = (
+    "SELECT count(*), count(DISTINCT id), count(DISTINCT _dlt_id), "
+    "count(_dlt_load_id) FROM test_logs.job_logs"
+)
+
+
+def test_batches_after_the_first_are_inserted_directly(
+    configure, query, monkeypatch
+):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    logger.info("first")
+    flush()
+    assert pipeline_module._direct_insert_pipeline is get_pipeline()
+
+    def no_run(*args, **kwargs):
+        raise AssertionError("unexpected DLT run")
+
+    monkeypatch.setattr(get_pipeline(), "run", no_run)
+    for i in range(3):
+        logger.info(f"direct {i}")
+    flush()
+
+    assert query(config.db_path, COUNTS) == [(4, 4, 4, 4)]
+
+
+def test_direct_inserts_are_recorded_as_completed_loads(configure, query):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    for i in range(3):
+        logger.info(f"batch {i}")
+        flush()
+
+    rows = query(
+        config.db_path,
+        "SELECT count(DISTINCT _dlt_load_id), count(load_id) "
+        "FROM test_logs.job_logs LEFT JOIN test_logs._dlt_loads "
+        "ON _dlt_load_id = load_id AND status = 0",
+    )
+    assert rows == [(3, 3)]
+
+
+def test_failed_direct_insert_falls_back_to_dlt(configure, query, monkeypatch):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    logger.info("first")
+    flush()
+
+    def broken_insert(pipeline, table):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(pipeline_module, "_insert_arrow", broken_insert)
+    logger.info("fallback")
+    flush()
+
+    assert query(config.db_path, COUNTS) == [(2, 2, 2, 2)]
+    assert pipeline_module._direct_insert_pipeline is get_pipeline()
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset()")
+def test_direct_and_dlt_rows_store_utc_timestamps(configure, query, monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        config = configure()
+        logger = dlt_logger.get_logger("tests")
+        logger.info("dlt")
+        flush()
+        logger.info("direct")
+        flush()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    rows = query(
+        config.db_path,
+        "SELECT message, epoch(timestamp) FROM test_logs.job_logs ORDER BY 1",
+    )
+    assert [message for message, _ in rows] == ["direct", "dlt"]
+    for _, seconds in rows:
+        assert abs(time.time() - seconds) < 60
+
+
+def test_pending_package_is_loaded_before_the_next_batch(
+    configure, query, monkeypatch
+):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    logger.info("first")
+    flush()
+
+    # A run that failed after normalizing leaves its package pending, and
+    # the next batch goes through DLT again
+    pipeline = get_pipeline()
+    pipeline.extract(job_logs([logger._create_log_entry("INFO", "pending", {})]))
+    pipeline.normalize()
+    assert pipeline.has_pending_data
+    monkeypatch.setattr(pipeline_module, "_direct_insert_pipeline", None)
+
+    logger.info("next")
+    flush()
+
+    rows = query(config.db_path, "SELECT message FROM test_logs.job_logs ORDER BY 1")
+    assert rows == [("first",), ("next",), ("pending",)]
+    assert not pipeline.has_pending_data
+
+
+def test_batch_waits_for_a_read_only_connection(configure, query):
+    config = configure()
+    logger = dlt_logger.get_logger("tests")
+    logger.info("first")
+    flush()
+
+    reader = duckdb.connect(config.db_path, read_only=True)
+    closer = threading.Timer(0.5, reader.close)
+    closer.start()
+    logger.info("second")
+    flush()
+    closer.join()
+
+    assert query(config.db_path, COUNTS) == [(2, 2, 2, 2)]
+
+
+def test_connection_is_released_when_idle(configure, query):
+    config = configure(batch_interval_s=0.05)
+    logger = dlt_logger.get_logger("tests")
+    logger.info("first")
+
+    # No flush: the writer closes its connection once the queue is empty
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            if query(config.db_path, COUNTS) == [(1, 1, 1, 1)]:
+                break
+        except duckdb.Error:
+            pass
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
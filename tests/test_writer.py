@@ -0,0 +1,190 @@
+"""Tests for the background writer."""
+
+import multiprocessing
+import os
+import threading
+import time
+
+import duckdb
+import pytest
+
+import dlt_logger
+from dlt_logger.dlt import flush, writer
+
+
+class _StalledWrites:
+    """Stands in for write_log_batch, holding each write until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.rows = []
+
+    def __call__(self, batch):
+        self.started.set()
+        self.release.wait(10)
+        self.rows.extend(batch)
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Record the batches the writer hands to write_log_batch."""
+    written = []
+    monkeypatch.setattr(writer, "write_log_batch", lambda b: written.append(list(b)))
+    return written
+
+
+@pytest.fixture
+def stalled(monkeypatch):
+    """Make every write wait until stalled.release is set."""
+    writes = _StalledWrites()
+    monkeypatch.setattr(writer, "write_log_batch", writes)
+    # Report errors as soon as they happen
+    monkeypatch.setattr(writer, "_ERROR_REPORT_INTERVAL_S", 0.0)
+    yield writes
+    writes.release.set()
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_batches_are_cut_at_batch_size(configure, batches):
+    configure(batch_size=3, batch_interval_s=30)
+    for i in range(7):
+        writer.write_log_entry({"n": i})
+    flush()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [row["n"] for batch in batches for row in batch] == list(range(7))
+
+
+def test_partial_batch_is_written_after_interval(configure, batches):
+    configure(batch_size=1000, batch_interval_s=0.1)
+    writer.write_log_entry({"n": 0})
+
+    assert _wait_for(lambda: batches)
+    assert batches == [[{"n": 0}]]
+
+
+def test_flush_ends_the_current_batch(configure, batches):
+    configure(batch_size=1000, batch_interval_s=30)
+    writer.write_log_entry({"n": 0})
+    writer.write_log_entry({"n": 1})
+
+    start = time.monotonic()
+    flush()
+
+    assert time.monotonic() - start < 5
+    assert batches == [[{"n": 0}, {"n": 1}]]
+
+
+def test_flush_without_queued_rows_returns(configure, batches):
+    configure()
+    flush()
+    assert batches == []
+
+
+def test_idle_writer_uses_new_batch_settings(configure, batches):
+    configure(batch_size=1000, batch_interval_s=30)
+    writer.write_log_entry({"n": 0})
+    flush()
+    # Let the writer go back to waiting for its next row
+    time.sleep(0.1)
+
+    configure(batch_size=1, batch_interval_s=30)
+    writer.write_log_entry({"n": 1})
+    writer.write_log_entry({"n": 2})
+
+    assert _wait_for(lambda: len(batches) == 3)
+    assert batches == [[{"n": 0}], [{"n": 1}], [{"n": 2}]]
+
+
+def test_drop_policy_discards_rows_and_reports_them(configure, stalled, capsys):
+    configure(batch_size=1, queue_size=5, overflow_policy="drop")
+    writer.write_log_entry({"n": 0})
+    assert stalled.started.wait(5)
+
+    # The writer is busy with row 0: five rows fit, three are dropped
+    for i in range(1, 9):
+        writer.write_log_entry({"n": i})
+    stalled.release.set()
+    flush()
+
+    assert [row["n"] for row in stalled.rows] == [0, 1, 2, 3, 4, 5]
+    assert "queue full, dropped 3 log entries" in capsys.readouterr().err
+
+
+def test_block_policy_waits_for_space(configure, stalled):
+    configure(batch_size=1, queue_size=2, overflow_policy="block")
+    writer.write_log_entry({"n": 0})
+    assert stalled.started.wait(5)
+
+    producer = threading.Thread(
+        target=lambda: [writer.write_log_entry({"n": i}) for i in range(1, 6)]
+    )
+    producer.start()
+    producer.join(0.3)
+    assert producer.is_alive()
+
+    stalled.release.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    flush()
+
+    assert [row["n"] for row in stalled.rows] == list(range(6))
+
+
+def test_write_errors_are_reported(configure, monkeypatch, capsys):
+    def fail(batch):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(writer, "write_log_batch", fail)
+    monkeypatch.setattr(writer, "_ERROR_REPORT_INTERVAL_S", 0.0)
+    configure()
+    writer.write_log_entry({"n": 0})
+    flush()
+
+    assert "DLT logging failed: RuntimeError: disk full" in capsys.readouterr().err
+
+
+def test_batch_is_retried_while_database_is_locked(configure, monkeypatch):
+    attempts = []
+
+    def locked_twice(batch):
+        attempts.append(list(batch))
+        if len(attempts) < 3:
+            raise duckdb.IOException('IO Error: Could not set lock on file "x"')
+
+    monkeypatch.setattr(writer, "write_log_batch", locked_twice)
+    monkeypatch.setattr(writer, "_LOCK_RETRY_DELAY_S", 0.001)
+    configure()
+    writer.write_log_entry({"n": 0})
+    flush()
+
+    assert attempts == [[{"n": 0}]] * 3
+
+
+def _log_in_child():
+    dlt_logger.get_logger("child").info("child")
+    flush()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_writes_its_own_rows(configure, query):
+    config = configure()
+    dlt_logger.get_logger("parent").info("parent")
+    flush()
+
+    child = multiprocessing.get_context("fork").Process(target=_log_in_child)
+    child.start()
+    child.join(60)
+    if child.is_alive():
+        child.kill()
+
+    assert child.exitcode == 0
+    rows = query(config.db_path, "SELECT message FROM test_logs.job_logs ORDER BY 1")
+    assert rows == [("child",), ("parent",)]